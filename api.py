@@ -6,14 +6,25 @@ Connects frontend and backend with clean REST API endpoints
 import os
 import json
 import tempfile
+import aiofiles
 from typing import List, Optional
-from fastapi import FastAPI, File, UploadFile, Form, HTTPException
+from fastapi import FastAPI, File, UploadFile, Form, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse
 import uvicorn
 
 # Import the backend processing function
-from main import run_system
+from main import (
+    run_system,
+    summarizer_lifespan,
+    audio_media_type,
+    content_hash,
+    file_etag,
+    etag_matches,
+    UPLOAD_CHUNK_SIZE,
+    AUDIO_CACHE_CONTROL,
+)
 
 # Create FastAPI app
 app = FastAPI(
@@ -21,7 +32,8 @@ app = FastAPI(
     description="AI-powered system that transforms research papers into audio podcasts",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=summarizer_lifespan
 )
 
 # Configure CORS for frontend
@@ -35,6 +47,7 @@ app.add_middleware(
 
 # Configuration
 OUTPUT_DIR = "outputs"
+AUDIO_EXTENSIONS = ('.mp3', '.wav', '.m4a')
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 @app.get("/")
@@ -98,11 +111,12 @@ async def process_papers(
                     suffix=".pdf",
                     dir=OUTPUT_DIR
                 )
+                temp_file.close()
                 try:
-                    # Write uploaded file content
-                    content = await pdf_file.read()
-                    temp_file.write(content)
-                    temp_file.close()
+                    # Stream uploaded file content to disk in fixed-size chunks
+                    async with aiofiles.open(temp_file.name, "wb") as buffer:
+                        while chunk := await pdf_file.read(UPLOAD_CHUNK_SIZE):
+                            await buffer.write(chunk)
                     pdf_paths.append(temp_file.name)
                 except Exception as e:
                     # Clean up on error
@@ -124,7 +138,9 @@ async def process_papers(
         print(f"  Topics: {len(topic_list)} entries")
         
         # Call the backend processing function
-        result = run_system(
+        # Run the blocking pipeline off the event loop so other endpoints stay responsive
+        result = await run_in_threadpool(
+            run_system,
             pdf_files=pdf_paths,
             doi_list=doi_list,
             urls=urls,
@@ -148,47 +164,63 @@ async def process_papers(
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 @app.get("/audio/{filename}")
-async def get_audio(filename: str):
+async def get_audio(filename: str, request: Request):
     """
     Serve generated audio files
     
     Args:
         filename: Name of the audio file to retrieve
+        request: Incoming request, checked for If-None-Match
     
     Returns:
-        Audio file response
+        Audio file response, or 304 Not Modified if the client copy is current
     """
     file_path = os.path.join(OUTPUT_DIR, filename)
     
     if not os.path.exists(file_path):
         raise HTTPException(status_code=404, detail="Audio file not found")
     
+    # Hashing reads the whole file on a cold cache, so keep it off the event loop
+    etag = await run_in_threadpool(file_etag, file_path)
+    headers = {"ETag": etag, "Cache-Control": AUDIO_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    
     return FileResponse(
         file_path,
-        media_type="audio/mpeg",
-        filename=filename
+        media_type=audio_media_type(filename),
+        filename=filename,
+        headers=headers
     )
 
 @app.get("/files")
-async def list_audio_files():
+async def list_audio_files(request: Request):
     """List all available audio files"""
     try:
         files = []
         if os.path.exists(OUTPUT_DIR):
-            for filename in os.listdir(OUTPUT_DIR):
-                if filename.endswith(('.mp3', '.wav', '.m4a')):
-                    file_path = os.path.join(OUTPUT_DIR, filename)
-                    file_size = os.path.getsize(file_path)
-                    files.append({
-                        "filename": filename,
-                        "size": file_size,
-                        "size_mb": round(file_size / (1024 * 1024), 2)
-                    })
+            # scandir gives full paths and file types without a path join; on Linux entry.stat() still stats each file
+            with os.scandir(OUTPUT_DIR) as entries:
+                for entry in entries:
+                    if entry.name.endswith(AUDIO_EXTENSIONS) and entry.is_file():
+                        file_size = entry.stat().st_size
+                        files.append({
+                            "filename": entry.name,
+                            "size": file_size,
+                            "size_mb": round(file_size / (1024 * 1024), 2)
+                        })
         
-        return {
+        listing = {
             "audio_files": files,
             "total_files": len(files)
         }
+        
+        # The listing is cheap to build but not to resend; let clients revalidate it
+        etag = f'"{content_hash(json.dumps(listing, sort_keys=True).encode())}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        return JSONResponse(listing, headers=headers)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error listing files: {str(e)}")
 
@@ -212,11 +244,11 @@ async def delete_all_audio_files():
     try:
         deleted_count = 0
         if os.path.exists(OUTPUT_DIR):
-            for filename in os.listdir(OUTPUT_DIR):
-                if filename.endswith(('.mp3', '.wav', '.m4a')):
-                    file_path = os.path.join(OUTPUT_DIR, filename)
-                    os.remove(file_path)
-                    deleted_count += 1
+            with os.scandir(OUTPUT_DIR) as entries:
+                for entry in entries:
+                    if entry.name.endswith(AUDIO_EXTENSIONS) and entry.is_file():
+                        os.remove(entry.path)
+                        deleted_count += 1
         
         return {
             "message": f"Deleted {deleted_count} audio files",
@@ -231,10 +263,21 @@ if __name__ == "__main__":
     print("🔗 Frontend should connect to: http://localhost:8000")
     print("🎧 Audio files will be stored in: outputs/")
     
+    # Each worker loads its own copy of the model, so multiple workers are opt-in.
+    # API_WORKERS=auto applies the (2 x cores) + 1 rule of thumb.
+    workers_setting = os.environ.get("API_WORKERS", "1")
+    if workers_setting == "auto":
+        workers = 2 * (os.cpu_count() or 1) + 1
+    else:
+        workers = int(workers_setting)
+    
     uvicorn.run(
         "api:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        loop="uvloop",
+        http="httptools",
+        reload=False,
+        workers=workers,
         log_level="info"
     ) 
\ No newline at end of file
@@ -249,10 +249,10 @@ with gr.Blocks(
         
         **Backend Technologies:**
         - FastAPI for API endpoints
-        - PyPDF2 for PDF text extraction
-        - BeautifulSoup for web scraping
+        - pypdfium2 (PDFium) for PDF text extraction
+        - selectolax (Lexbor) for web scraping
         - Transformers (DistilBART) for summarization
-        - Google Text-to-Speech for audio generation
+        - Piper (local neural TTS) for audio generation
         
         **Processing Pipeline:**
         1. **Input Processing**: Extract text from PDFs, fetch DOI metadata, scrape URLs
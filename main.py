@@ -2,25 +2,155 @@
 
 # --- Imports ---
 import os
-import requests
+import re
+import io
+import time
+import shutil
+import tempfile
+# Must be set before tokenizers is imported; the pipeline is called from worker threads
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+import hashlib
+import asyncio
+import httpx
 import json
-from bs4 import BeautifulSoup
-from PyPDF2 import PdfReader
-from transformers import pipeline
-from gtts import gTTS
-from typing import List
-from fastapi import FastAPI, File, UploadFile, Form
+import wave
+import threading
+import torch
+import aiofiles
+import ahocorasick
+from selectolax.lexbor import LexborHTMLParser
+import pypdfium2 as pdfium
+from transformers import AutoTokenizer, pipeline
+from piper import PiperVoice
+from diskcache import Cache
+from typing import List, Optional
+from functools import lru_cache
+from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from fastapi import FastAPI, File, UploadFile, Form, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
 import uvicorn
 
+try:
+    from blake3 import blake3 as _hasher
+except ImportError:
+    _hasher = hashlib.blake2b
+
+try:
+    import liburing  # Linux 5.6+ only
+except ImportError:
+    liburing = None
+
 # --- Constants ---
-SUMMARY_PIPELINE = pipeline("summarization", model="sshleifer/distilbart-cnn-12-6")
 OUTPUT_DIR = "outputs"
 os.makedirs(OUTPUT_DIR, exist_ok=True)
+SUMMARY_MODEL = "sshleifer/distilbart-cnn-12-6"
+SUMMARY_DEVICE = 0 if torch.cuda.is_available() else -1
+SUMMARY_BATCH_SIZE = 16
+SYNTHESIS_MAX_LENGTH = 300
+SHORT_TEXT_THRESHOLD = 400  # characters; below this the model would mostly echo its input
+PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+# Roughly one thread per physical core, to avoid oversubscription with hyperthreads and the web threadpool
+SUMMARY_THREADS = max(1, (os.cpu_count() or 2) // 2)
+torch.set_num_threads(SUMMARY_THREADS)
+QUANTIZED_MODEL_DIR = os.path.join(OUTPUT_DIR, "distilbart_int8")
+PIPER_VOICE_PATH = os.environ.get("PIPER_VOICE", "en_US-lessac-medium.onnx")
+UPLOAD_CHUNK_SIZE = 64 * 1024
+IO_URING_DEPTH = 32
+# Audio is regenerated under the same names (e.g. final_synthesis.wav), so always revalidate via ETag
+AUDIO_CACHE_CONTROL = "no-cache"
+AUDIO_MEDIA_TYPES = {".wav": "audio/wav", ".mp3": "audio/mpeg", ".m4a": "audio/mp4"}
+SUMMARY_CACHE = Cache(os.path.join(OUTPUT_DIR, "summary_cache"), eviction_policy="least-recently-used")
+DOI_CACHE = Cache(os.path.join(OUTPUT_DIR, "crossref_cache"))
+DOI_CACHE_TTL = 86400  # seconds before a cached CrossRef record is revalidated
+
+def load_int8_onnx_pipeline():
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM
+    from onnxruntime import SessionOptions
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    # Export and quantize once; later runs load the int8 weights straight from disk
+    if not os.path.isdir(QUANTIZED_MODEL_DIR):
+        # Private export dir per process: several workers may export at once
+        export_dir = tempfile.mkdtemp(prefix="distilbart_int8.", dir=OUTPUT_DIR)
+        try:
+            ORTModelForSeq2SeqLM.from_pretrained(SUMMARY_MODEL, export=True).save_pretrained(export_dir)
+            AutoTokenizer.from_pretrained(SUMMARY_MODEL).save_pretrained(export_dir)
+            for name in os.listdir(export_dir):
+                if name.endswith(".onnx"):
+                    onnx_path = os.path.join(export_dir, name)
+                    quantize_dynamic(onnx_path, onnx_path + ".int8", weight_type=QuantType.QInt8)
+                    os.replace(onnx_path + ".int8", onnx_path)
+            os.rename(export_dir, QUANTIZED_MODEL_DIR)
+        except OSError:
+            shutil.rmtree(export_dir, ignore_errors=True)
+            # Losing the rename race to another worker is fine: use its copy
+            if not os.path.isdir(QUANTIZED_MODEL_DIR):
+                raise
+        except Exception:
+            shutil.rmtree(export_dir, ignore_errors=True)
+            raise
+
+    # torch.set_num_threads does not reach ONNX Runtime's own intra-op pool
+    session_options = SessionOptions()
+    session_options.intra_op_num_threads = SUMMARY_THREADS
+    ort_model = ORTModelForSeq2SeqLM.from_pretrained(
+        QUANTIZED_MODEL_DIR, provider="CPUExecutionProvider", session_options=session_options
+    )
+    tokenizer = AutoTokenizer.from_pretrained(QUANTIZED_MODEL_DIR)
+    return pipeline("summarization", model=ort_model, tokenizer=tokenizer, framework="pt", num_workers=0)
+
+def load_summary_pipeline():
+    """FP32 on GPU; int8 ONNX Runtime on CPU when optimum/onnxruntime are installed."""
+    if SUMMARY_DEVICE < 0:
+        try:
+            return load_int8_onnx_pipeline()
+        except ImportError:
+            print("⚠️ optimum/onnxruntime not installed, using FP32 summarizer")
+        except Exception as e:
+            print("⚠️ int8 ONNX export failed, using FP32 summarizer:", e)
+    summarizer = pipeline(
+        "summarization", model=SUMMARY_MODEL, device=SUMMARY_DEVICE, framework="pt", num_workers=0
+    )
+    summarizer.model.eval()
+    return summarizer
+
+_PIPELINE = None
+_PIPELINE_LOCK = threading.Lock()
+
+def get_pipeline():
+    """Load the summarizer on first use, so endpoints that never summarize never pay for the weights."""
+    global _PIPELINE
+    if _PIPELINE is None:
+        with _PIPELINE_LOCK:
+            if _PIPELINE is None:
+                _PIPELINE = load_summary_pipeline()
+    return _PIPELINE
+
+@asynccontextmanager
+async def summarizer_lifespan(app):
+    # Set PREWARM_SUMMARIZER=1 on workers that serve /process to load the model before the first request
+    if os.environ.get("PREWARM_SUMMARIZER") == "1":
+        await run_in_threadpool(get_pipeline)
+    yield
+
+_VOICE = None
+_VOICE_LOCK = threading.Lock()
+_PDFIUM_LOCK = threading.Lock()
+
+def get_voice():
+    """Load the Piper voice on first use, so a missing voice file only affects audio generation."""
+    global _VOICE
+    if _VOICE is None:
+        with _VOICE_LOCK:
+            if _VOICE is None:
+                _VOICE = PiperVoice.load(PIPER_VOICE_PATH)
+    return _VOICE
 
 # --- FastAPI App ---
-app = FastAPI(title="Research Paper Podcast System", version="1.0.0")
+app = FastAPI(title="Research Paper Podcast System", version="1.0.0", lifespan=summarizer_lifespan)
 
 # Add CORS middleware
 app.add_middleware(
@@ -35,18 +165,63 @@ app.add_middleware(
 #   1. PDF TEXT EXTRACTION
 # ========================== #
 def extract_text_from_pdf(file_path):
-    reader = PdfReader(file_path)
-    text = "\n".join(page.extract_text() for page in reader.pages if page.extract_text())
-    return text
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        page_texts = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            page_texts.append(textpage.get_text_range())
+            textpage.close()
+            page.close()
+    finally:
+        pdf.close()
+    # PDFium emits CRLF line breaks; normalize so paragraph splitting on blank lines still works
+    text = "\n".join(page_text for page_text in page_texts if page_text)
+    return text.replace("\r\n", "\n")
+
+def extract_texts_from_pdfs(file_paths: List[str]) -> List[str]:
+    # PDFium is not thread-safe, so parallelize across processes rather than threads
+    if len(file_paths) <= 1:
+        # In-process extraction can run on several request threads at once
+        with _PDFIUM_LOCK:
+            return [extract_text_from_pdf(path) for path in file_paths]
+    with ProcessPoolExecutor(max_workers=min(len(file_paths), os.cpu_count() or 1)) as executor:
+        return list(executor.map(extract_text_from_pdf, file_paths))
 
 # ========================== #
 #   2. DOI Metadata Fetch
 # ========================== #
-def resolve_doi(doi):
-    url = f"https://api.crossref.org/works/{doi}"
-    response = requests.get(url)
-    if response.status_code == 200:
-        data = response.json()["message"]
+async def fetch_crossref_record(doi, client: httpx.AsyncClient):
+    # DOI records barely change: serve fresh entries from disk, revalidate stale ones with If-None-Match
+    cached = DOI_CACHE.get(doi)
+    if cached and time.time() - cached["fetched_at"] < DOI_CACHE_TTL:
+        return cached["message"]
+    headers = {"If-None-Match": cached["etag"]} if cached and cached["etag"] else {}
+    try:
+        response = await client.get(f"https://api.crossref.org/works/{doi}", headers=headers)
+    except httpx.HTTPError:
+        # A stale record beats no record when CrossRef is unreachable
+        if cached:
+            return cached["message"]
+        raise
+    if response.status_code == 304 and cached:
+        message = cached["message"]
+    elif response.status_code == 200:
+        message = response.json()["message"]
+    else:
+        return cached["message"] if cached else None
+    etag = response.headers.get("etag") or (cached["etag"] if cached else None)
+    DOI_CACHE.set(doi, {"message": message, "etag": etag, "fetched_at": time.time()})
+    return message
+
+async def resolve_doi(doi, client: httpx.AsyncClient):
+    try:
+        data = await fetch_crossref_record(doi, client)
+    except httpx.HTTPError as e:
+        # One unreachable lookup must not fail the whole batch
+        print(f"❌ Failed to fetch DOI {doi}: {e}")
+        data = None
+    if data is not None:
         return {
             "title": data.get("title", [""])[0],
             "authors": [a.get("family") for a in data.get("author", [])],
@@ -57,112 +232,296 @@ def resolve_doi(doi):
         }
     return {"error": "DOI not found"}
 
+def format_doi_text(metadata):
+    abstract = metadata.get("abstract", "")
+    abstract = abstract.replace("<jats:p>", "").replace("</jats:p>", "") if abstract else ""
+    return f"Title: {metadata['title']}\nJournal: {metadata['journal']}\nAuthors: {', '.join(metadata['authors'])}\n\nAbstract: {abstract}"
+
 # ========================== #
 #   3. URL Content Fetch
 # ========================== #
-def fetch_url_text(url):
+async def fetch_url_text(url, client: httpx.AsyncClient):
     try:
-        resp = requests.get(url, timeout=10)
-        soup = BeautifulSoup(resp.text, "html.parser")
-        paragraphs = soup.find_all("p")
-        content = "\n".join(p.get_text() for p in paragraphs)
+        resp = await client.get(url)
+        tree = LexborHTMLParser(resp.text)
+        content = "\n".join(p.text() for p in tree.css("p"))
         return content
     except Exception as e:
         print(f"❌ Failed to fetch URL {url}: {e}")
         return ""
 
+async def fetch_remote_sources(doi_list: List[str], urls: List[str]):
+    # One shared client so concurrent requests reuse TCP/TLS connections
+    limits = httpx.Limits(max_connections=32)
+    async with httpx.AsyncClient(http2=True, timeout=10, limits=limits, follow_redirects=True) as client:
+        tasks = [resolve_doi(doi, client) for doi in doi_list] + [fetch_url_text(url, client) for url in urls]
+        results = await asyncio.gather(*tasks)
+    return results[:len(doi_list)], results[len(doi_list):]
+
+def run_coroutine(coro):
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    # Called from inside an event loop (e.g. an async endpoint): run on a fresh loop in a worker thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
 # ========================== #
 #   4. TOPIC CLASSIFICATION
 # ========================== #
-def classify_topic(text: str, topics: List[str]):
-    return max(topics, key=lambda topic: text.lower().count(topic.lower())) if topics else "Unspecified"
+@lru_cache(maxsize=128)
+def build_topic_automaton(topics: tuple):
+    automaton = ahocorasick.Automaton()
+    for idx, topic in enumerate(topics):
+        keyword = topic.lower()
+        if keyword:
+            # Duplicate topics share one keyword, so keep every index it maps to
+            automaton.add_word(keyword, (keyword, automaton.get(keyword, (keyword, ()))[1] + (idx,)))
+    automaton.make_automaton()
+    return automaton
+
+def classify_topic(text: str, topics: List[str], already_lower: bool = False):
+    if not topics:
+        return "Unspecified"
+    # Count every topic in a single pass over the lowercased text
+    automaton = build_topic_automaton(tuple(topics))
+    counts = [0] * len(topics)
+    if len(automaton):
+        # Matches arrive in end-position order; skip ones overlapping the keyword's previous match
+        # so counts agree with str.count
+        last_end = {}
+        for end, (keyword, indices) in automaton.iter(text if already_lower else text.lower()):
+            if end - len(keyword) < last_end.get(keyword, -1):
+                continue
+            last_end[keyword] = end
+            for idx in indices:
+                counts[idx] += 1
+    return topics[counts.index(max(counts))]
 
 # ========================== #
 #   5. SUMMARY GENERATION
 # ========================== #
-def generate_summary(text: str):
-    paragraphs = [p.strip() for p in text.split('\n\n') if len(p.strip()) > 100]
+def content_hash(data: bytes) -> str:
+    return _hasher(data).hexdigest()
+
+def summarize_paragraphs(paragraphs: List[str], max_length: int = 200, min_length: int = 50) -> List[str]:
+    # Generation params are part of the key so changing them never serves a stale summary
+    keys = [content_hash(f"{max_length}:{min_length}:{p}".encode()) for p in paragraphs]
+    results = [SUMMARY_CACHE.get(key) for key in keys]
+    missed = [i for i, result in enumerate(results) if result is None]
+    if missed:
+        with torch.inference_mode():
+            outputs = get_pipeline()(
+                [paragraphs[i] for i in missed],
+                batch_size=SUMMARY_BATCH_SIZE, truncation=True, max_length=max_length, min_length=min_length
+            )
+        for i, output in zip(missed, outputs):
+            results[i] = output["summary_text"]
+            SUMMARY_CACHE.set(keys[i], results[i])
+    return results
+
+def split_paragraphs(text: str) -> List[str]:
+    # Whitespace-only lines count as paragraph breaks and runs of blank lines collapse into one
+    return [paragraph for chunk in PARAGRAPH_BREAK.split(text) if len(paragraph := chunk.strip()) > 100]
+
+def summarize_texts(texts: List[str], max_length: int = 200) -> List[str]:
+    # Flatten every paragraph of every text into one batch, then regroup per text
+    results = [None] * len(texts)
+    owners = []
+    flat_paragraphs = []
+    for idx, text in enumerate(texts):
+        paragraphs = split_paragraphs(text)
+        if sum(len(p) for p in paragraphs) < SHORT_TEXT_THRESHOLD:
+            # Too short to be worth a forward pass; keep it out of the batch entirely
+            results[idx] = " ".join(paragraphs)[:1000]
+            continue
+        for paragraph in paragraphs:
+            owners.append(idx)
+            flat_paragraphs.append(paragraph)
     try:
-        summaries = SUMMARY_PIPELINE(paragraphs, truncation=True, max_length=200, min_length=50)
-        return " ".join([s["summary_text"] for s in summaries])
+        flat_summaries = summarize_paragraphs(flat_paragraphs, max_length=max_length)
     except Exception as e:
         print("⚠️ Summarization failed:", e)
-        return "Summary unavailable."
+        return [result if result is not None else "Summary unavailable." for result in results]
+    grouped = {}
+    for idx, summary in zip(owners, flat_summaries):
+        grouped.setdefault(idx, []).append(summary)
+    for idx, parts in grouped.items():
+        results[idx] = " ".join(parts)
+    return results
+
+def generate_summary(text: str):
+    return summarize_texts([text])[0]
 
 # ========================== #
 #   6. CROSS-PAPER SYNTHESIS
 # ========================== #
 def synthesize_across_papers(summaries: List[str]):
-    return generate_summary(" ".join(summaries))
+    # The combined text depends on the per-paper outputs, so it cannot share their forward
+    # pass; it reuses the same batched, cached path with a longer output budget instead
+    return summarize_texts([" ".join(summaries)], max_length=SYNTHESIS_MAX_LENGTH)[0]
 
 # ========================== #
 #   7. AUDIO SYNTHESIS
 # ========================== #
+def synthesize_wav_bytes(text: str) -> bytes:
+    # Local Piper voice: no network round-trip, sentences are split and synthesized in-process
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        get_voice().synthesize_wav(text, wav_file)
+    return buffer.getvalue()
+
+def _write_files_io_uring(paths: List[str], payloads: List[bytes]):
+    ring = liburing.io_uring()
+    cqe = liburing.io_uring_cqe()
+    liburing.io_uring_queue_init(IO_URING_DEPTH, ring, 0)
+    fds = []
+    try:
+        for path in paths:
+            fds.append(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644))
+        writes = list(zip(fds, payloads))
+        # One io_uring_enter per batch of IO_URING_DEPTH writes instead of one write() per file
+        for start in range(0, len(writes), IO_URING_DEPTH):
+            batch = writes[start:start + IO_URING_DEPTH]
+            for fd, payload in batch:
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_write(sqe, fd, payload, len(payload), 0)
+            liburing.io_uring_submit(ring)
+            for _ in batch:
+                liburing.io_uring_wait_cqe(ring, cqe)
+                result = cqe.res
+                liburing.io_uring_cqe_seen(ring, cqe)
+                if result < 0:
+                    raise OSError(-result, os.strerror(-result))
+        # Finish any short writes synchronously
+        for fd, payload in writes:
+            written = os.fstat(fd).st_size
+            while written < len(payload):
+                written += os.pwrite(fd, payload[written:], written)
+    finally:
+        for fd in fds:
+            os.close(fd)
+        liburing.io_uring_queue_exit(ring)
+
+def write_files(paths: List[str], payloads: List[bytes]):
+    # Truncated filenames can collide; keep only the last payload per path, as sequential writes would
+    files = dict(zip(paths, payloads))
+    paths, payloads = list(files), list(files.values())
+    # A ring only pays off when it batches several writes
+    if liburing is not None and len(paths) > 1:
+        try:
+            _write_files_io_uring(paths, payloads)
+            return
+        except (OSError, AttributeError, TypeError) as e:
+            # AttributeError/TypeError: a liburing release with a different Python API
+            print("⚠️ io_uring write failed, falling back to regular writes:", e)
+    for path, payload in zip(paths, payloads):
+        with open(path, "wb") as f:
+            f.write(payload)
+
 def generate_audio(text: str, filename: str):
-    tts = gTTS(text=text, lang='en')
-    output_path = os.path.join(OUTPUT_DIR, f"{filename}.mp3")
-    tts.save(output_path)
-    return output_path
+    return generate_audio_batch([text], [filename])[0]
+
+def generate_audio_batch(texts: List[str], filenames: List[str]) -> List[str]:
+    output_paths = [os.path.join(OUTPUT_DIR, f"{filename}.wav") for filename in filenames]
+    write_files(output_paths, [synthesize_wav_bytes(text) for text in texts])
+    return output_paths
+
+def audio_media_type(filename: str) -> str:
+    return AUDIO_MEDIA_TYPES.get(os.path.splitext(filename)[1].lower(), "application/octet-stream")
 
 # ========================== #
 #   8. SYSTEM RUNNER
 # ========================== #
+def url_to_filename(url):
+    filename = url.replace("https://", "").replace("http://", "").replace("/", "_")
+    return filename[:30]  # trim filename
+
 def run_system(pdf_files=[], topic_list=[], doi_list=[], urls=[]):
-    all_summaries = []
-    citations = []
+    # Each stage runs over all sources at once; sources, texts, filenames, summaries,
+    # topics and audio_paths are parallel lists indexed by source
 
-    # --- Process PDFs ---
+    # --- Stage 1: extract text (PDFs in a process pool, DOIs and URLs concurrently) ---
     for pdf_path in pdf_files:
         print(f"📄 Processing PDF: {pdf_path}")
-        raw_text = extract_text_from_pdf(pdf_path)
-        summary = generate_summary(raw_text)
-        topic = classify_topic(summary, topic_list)
-        audio_path = generate_audio(summary, os.path.basename(pdf_path).replace(".pdf", ""))
-        all_summaries.append(summary)
-        citations.append({"source": pdf_path, "topic": topic, "audio": audio_path})
-
-    # --- Process DOIs ---
-    for doi in doi_list:
+    pdf_texts = extract_texts_from_pdfs(pdf_files)
+    doi_metadata, url_contents = run_coroutine(fetch_remote_sources(doi_list, urls))
+
+    resolved_dois = []
+    for doi, metadata in zip(doi_list, doi_metadata):
         print(f"🌐 Processing DOI: {doi}")
-        metadata = resolve_doi(doi)
         if "error" not in metadata:
-            abstract = metadata.get("abstract", "")
-            abstract = abstract.replace("<jats:p>", "").replace("</jats:p>", "") if abstract else ""
-            meta_text = f"Title: {metadata['title']}\nJournal: {metadata['journal']}\nAuthors: {', '.join(metadata['authors'])}\n\nAbstract: {abstract}"
-            summary = generate_summary(meta_text)
-            topic = classify_topic(summary, topic_list)
-            audio_path = generate_audio(summary, doi.replace("/", "_"))
-            all_summaries.append(summary)
-            citations.append({"source": doi, "topic": topic, "audio": audio_path})
+            resolved_dois.append((doi, metadata))
         else:
             print("❌ DOI not found or invalid.")
-
-    # --- Process URLs ---
     for url in urls:
         print(f"🌐 Processing URL: {url}")
-        content = fetch_url_text(url)
-        summary = generate_summary(content)
-        topic = classify_topic(summary, topic_list)
-        filename = url.replace("https://", "").replace("http://", "").replace("/", "_")
-        audio_path = generate_audio(summary, filename[:30])  # trim filename
-        all_summaries.append(summary)
-        citations.append({"source": url, "topic": topic, "audio": audio_path})
-
-    # --- Final Cross-Paper Summary ---
-    if all_summaries:
+
+    sources = list(pdf_files) + [doi for doi, _ in resolved_dois] + list(urls)
+    texts = pdf_texts + [format_doi_text(metadata) for _, metadata in resolved_dois] + list(url_contents)
+    filenames = (
+        [os.path.basename(pdf_path).replace(".pdf", "") for pdf_path in pdf_files]
+        + [doi.replace("/", "_") for doi, _ in resolved_dois]
+        + [url_to_filename(url) for url in urls]
+    )
+
+    # --- Stage 2: summarize every source in one batched pass ---
+    summaries = summarize_texts(texts)
+
+    # --- Stage 3: classify ---
+    lowered_summaries = [summary.lower() for summary in summaries] if topic_list else summaries
+    topics = [classify_topic(lowered, topic_list, already_lower=True) for lowered in lowered_summaries]
+
+    # --- Stage 4: final cross-paper summary ---
+    if summaries:
         print("🧠 Synthesizing final audio summary from all papers...")
-        final_summary = synthesize_across_papers(all_summaries)
-        synthesis_audio_path = generate_audio(final_summary, "final_synthesis")
+        final_summary = synthesize_across_papers(summaries)
     else:
         final_summary = ""
+
+    # --- Stage 5: audio for every source plus the synthesis, written in one batch ---
+    if summaries:
+        audio_paths = generate_audio_batch(summaries + [final_summary], filenames + ["final_synthesis"])
+        synthesis_audio_path = audio_paths.pop()
+    else:
+        audio_paths = []
         synthesis_audio_path = None
 
+    citations = [
+        {"source": source, "topic": topic, "audio": audio_path}
+        for source, topic, audio_path in zip(sources, topics, audio_paths)
+    ]
+
     return {
         "synthesis": final_summary,
         "synthesis_audio": synthesis_audio_path,
         "citations": citations
     }
 
+# ========================== #
+#   HTTP CACHE VALIDATION
+# ========================== #
+@lru_cache(maxsize=1024)
+def _file_digest(path: str, mtime_ns: int, size: int) -> str:
+    # mtime/size are part of the cache key so a regenerated file is re-hashed
+    hasher = _hasher()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(UPLOAD_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+def file_etag(path: str) -> str:
+    stat = os.stat(path)
+    return f'"{_file_digest(path, stat.st_mtime_ns, stat.st_size)}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    candidates = [tag[2:] if tag.startswith("W/") else tag for tag in candidates]
+    return "*" in candidates or etag in candidates
+
 # ========================== #
 #   FASTAPI ENDPOINTS
 # ========================== #
@@ -188,13 +547,14 @@ async def process_papers(
         for pdf_file in pdf_files:
             if pdf_file.filename.endswith('.pdf'):
                 temp_path = os.path.join(OUTPUT_DIR, pdf_file.filename)
-                with open(temp_path, "wb") as buffer:
-                    content = await pdf_file.read()
-                    buffer.write(content)
+                async with aiofiles.open(temp_path, "wb") as buffer:
+                    while chunk := await pdf_file.read(UPLOAD_CHUNK_SIZE):
+                        await buffer.write(chunk)
                 pdf_paths.append(temp_path)
         
-        # Run the system
-        result = run_system(
+        # Run the system off the event loop so other endpoints stay responsive
+        result = await run_in_threadpool(
+            run_system,
             pdf_files=pdf_paths,
             topic_list=topic_list,
             doi_list=doi_list,
@@ -207,10 +567,15 @@ async def process_papers(
         return {"error": str(e)}
 
 @app.get("/audio/{filename}")
-async def get_audio(filename: str):
+async def get_audio(filename: str, request: Request):
     audio_path = os.path.join(OUTPUT_DIR, filename)
     if os.path.exists(audio_path):
-        return FileResponse(audio_path, media_type="audio/mpeg")
+        # Hashing reads the whole file on a cold cache, so keep it off the event loop
+        etag = await run_in_threadpool(file_etag, audio_path)
+        headers = {"ETag": etag, "Cache-Control": AUDIO_CACHE_CONTROL}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        return FileResponse(audio_path, media_type=audio_media_type(filename), headers=headers)
     else:
         return {"error": "Audio file not found"}
 
@@ -222,7 +587,7 @@ if __name__ == "__main__":
     
     if len(sys.argv) > 1 and sys.argv[1] == "api":
         # Run as API server
-        uvicorn.run(app, host="0.0.0.0", port=8000)
+        uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
     else:
         # Run as CLI
         print("=== 🎧 RESEARCH PAPER PODCAST SYSTEM ===")